@@ -6,6 +6,8 @@ from eda_file_parser.parser import (
     SummaryStats,
     AnalysisConfig,
     parse_report,
+    parse_report_factory,
+    parse_reports,
 )
 
 __version__ = "0.1.0"
@@ -16,4 +18,6 @@ __all__ = [
     "SummaryStats",
     "AnalysisConfig",
     "parse_report",
+    "parse_report_factory",
+    "parse_reports",
 ]
@@ -1,10 +1,42 @@
 import sys
 import argparse
 import logging
+import os
+import math
+import mmap
+import linecache
+import functools
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Final, Optional, Union, overload
 
-@dataclass
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Path type codes stored in TimingReport.ptype_arr
+PATH_TYPES: Final = ("min", "max")
+
+# Reports at least this large are memory-mapped instead of read into memory;
+# tests lower it to cover the mmap path
+_MMAP_THRESHOLD = 1 << 24
+
+# Line prefixes and markers recognized by parse_report (matched on raw bytes)
+START_PREFIX:   Final = b"Startpoint:"
+END_PREFIX:     Final = b"Endpoint:"
+GROUP_PREFIX:   Final = b"Path Group:"
+TYPE_PREFIX:    Final = b"Path Type:"
+REQUIRED_MARK:  Final = b"data required time"
+ARRIVAL_MARK:   Final = b"data arrival time"
+SLACK_MARK:     Final = b"slack"
+
+
+# Report contents as scanned by parse_report
+ReportBuffer = Union[bytes, mmap.mmap]
+
+
+@dataclass(slots=True)
 class TimingPath:
     """
     Represents a single timing path from an EDA timing report.
@@ -56,23 +88,235 @@ class TimingPath:
         ]
         return "\n".join(lines)
 
-    
-@dataclass 
+
+class _PathView(Sequence[TimingPath]):
+    """
+    Read-only sequence of the timing paths in a TimingReport.
+
+    Nothing is copied; each TimingPath is built from the report columns
+    when its row is indexed or iterated over.
+    """
+    __slots__ = ("_report",)
+
+    def __init__(self, report: 'TimingReport') -> None:
+        self._report = report
+
+    def __len__(self) -> int:
+        """Return the number of timing paths in the report."""
+        return len(self._report)
+
+    @overload
+    def __getitem__(self, index: int) -> TimingPath: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[TimingPath]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[TimingPath, list[TimingPath]]:
+        """Build the path at a row, or a list of paths for a slice.
+        
+        Args:
+            index: Row of the path (negative values count from the end) or a slice of rows.
+            
+        Returns:
+            TimingPath or list[TimingPath]: New objects holding the values of those rows.
+        """
+        if isinstance(index, slice):
+            return list(self._report.iter_paths(np.arange(len(self))[index]))
+        return self._report[index]
+
+    def __iter__(self) -> Iterator[TimingPath]:
+        """Build each timing path in report order."""
+        return self._report.iter_paths()
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the paths with a list or another view, element by element."""
+        if isinstance(other, _PathView) and other._report is self._report:
+            return True
+        if isinstance(other, (list, _PathView)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"<{len(self)} timing paths>"
+
+
+@dataclass(eq=False, slots=True)
 class TimingReport:
     """
     Container for parsed timing report data.
+
+    Path data is stored column-wise, one entry per path in each column.
+    TimingPath objects are only built when a path is indexed.
     
     Attributes:
-        paths: List of all timing paths found in the report.
+        startpoints: Startpoint of each path.
+        endpoints: Endpoint of each path.
+        path_groups: Path group of each path.
+        required_arr: Required time of each path (NaN if not found).
+        arrival_arr: Arrival time of each path (NaN if not found).
+        slack_arr: Slack of each path (NaN if not found).
+        ptype_arr: Path type code of each path, an index into path_type_names (-1 if not found).
+        path_type_names: Path type for each code; 0 is "min" and 1 is "max".
+        known_arr: Whether each path has a slack value (derived from slack_arr).
+        violated_arr: Whether each path has negative slack (derived from slack_arr).
         worst_min_path_index: Index of the path with worst (minimum) slack for min analysis.
         worst_max_path_index: Index of the path with worst (minimum) slack for max analysis.
     """
-    paths: list[TimingPath] = field(default_factory=list)
+    startpoints:    list[str] = field(default_factory=list)
+    endpoints:      list[str] = field(default_factory=list)
+    path_groups:    list[str] = field(default_factory=list)
+    required_arr:   np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    arrival_arr:    np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    slack_arr:      np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    ptype_arr:      np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    path_type_names: list[str] = field(default_factory=lambda: list(PATH_TYPES))
     worst_min_path_index: Optional[int] = None
     worst_max_path_index: Optional[int] = None
+    known_arr:      np.ndarray = field(init=False, repr=False)
+    violated_arr:   np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the slack status columns so status filters need no float compares."""
+        self.known_arr = ~np.isnan(self.slack_arr)
+        self.violated_arr = self.slack_arr < 0.0
+
+    @classmethod
+    def from_paths(cls, paths: list[TimingPath]) -> 'TimingReport':
+        """Build a report from already constructed TimingPath objects.
+        
+        Args:
+            paths: Timing paths to store in the report, in order.
+            
+        Returns:
+            TimingReport: Report holding the paths column-wise.
+        """
+        type_codes = {name: code for code, name in enumerate(PATH_TYPES)}
+        ptypes = [type_codes.setdefault(p.path_type, len(type_codes)) if p.path_type else -1
+                  for p in paths]
+
+        return cls(
+            startpoints=[p.startpoint for p in paths],
+            endpoints=[p.endpoint for p in paths],
+            path_groups=[p.path_group for p in paths],
+            required_arr=np.array([_nan_if_none(p.required_time) for p in paths], dtype=np.float64),
+            arrival_arr=np.array([_nan_if_none(p.arrival_time) for p in paths], dtype=np.float64),
+            slack_arr=np.array([_nan_if_none(p.slack) for p in paths], dtype=np.float64),
+            ptype_arr=np.array(ptypes, dtype=np.int32),
+            path_type_names=list(type_codes),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of timing paths in the report."""
+        return len(self.startpoints)
+
+    def __bool__(self) -> bool:
+        """Keep reports truthy when empty, as before __len__ was defined."""
+        return True
+
+    def __getitem__(self, index: int) -> TimingPath:
+        """Build the TimingPath stored at the given row.
+        
+        Args:
+            index: Row of the path in the report (negative values count from the end).
+            
+        Returns:
+            TimingPath: A new object holding the values of that row.
+        """
+        # item() returns Python scalars, avoiding a NumPy scalar per field
+        code = self.ptype_arr.item(index)
+        return TimingPath(
+            startpoint=self.startpoints[index],
+            endpoint=self.endpoints[index],
+            path_group=self.path_groups[index],
+            path_type=self.path_type_names[code] if code >= 0 else "",
+            required_time=_none_if_nan(self.required_arr.item(index)),
+            arrival_time=_none_if_nan(self.arrival_arr.item(index)),
+            slack=_none_if_nan(self.slack_arr.item(index)),
+        )
+
+    def iter_paths(self, rows: Optional[np.ndarray] = None) -> Iterator[TimingPath]:
+        """Build the timing paths at the given rows, e.g. from filter_indices.
+
+        Columns are read in bulk with tolist(), so no NumPy scalar is created
+        per field.
+        
+        Args:
+            rows: Row indices to build, in order (default: every row).
+            
+        Returns:
+            Iterator[TimingPath]: One new TimingPath per row.
+        """
+        if rows is None:
+            startpoints, endpoints, path_groups = self.startpoints, self.endpoints, self.path_groups
+            columns = (self.required_arr, self.arrival_arr, self.slack_arr, self.ptype_arr)
+        else:
+            rows = np.asarray(rows, dtype=np.intp)
+            index = rows.tolist()
+            startpoints = [self.startpoints[i] for i in index]
+            endpoints = [self.endpoints[i] for i in index]
+            path_groups = [self.path_groups[i] for i in index]
+            columns = (self.required_arr[rows], self.arrival_arr[rows], self.slack_arr[rows], self.ptype_arr[rows])
 
-    # def get_path(self, index: int) -> TimingPath:
-    #     return self.paths[index]
+        required, arrival, slack, ptype = (column.tolist() for column in columns)
+        names = self.path_type_names
+        for start, end, group, code, req, arr, slk in zip(
+            startpoints, endpoints, path_groups, ptype, required, arrival, slack
+        ):
+            yield TimingPath(start, end, group, names[code] if code >= 0 else "",
+                             _none_if_nan(req), _none_if_nan(arr), _none_if_nan(slk))
+
+    @property
+    def paths(self) -> Sequence[TimingPath]:
+        """View the report as a sequence of timing paths.
+
+        Paths are only built for the rows that are accessed.
+        
+        Returns:
+            Sequence[TimingPath]: Lazy view building one new TimingPath per accessed row.
+        """
+        return _PathView(self)
+
+    def filter_indices(
+        self,
+        status: Optional[str] = None,
+        path_type: Optional[str] = None,
+        path_group: Optional[str] = None,
+    ) -> np.ndarray:
+        """Find the paths matching every given filter.
+
+        Each filter is evaluated as one boolean mask over the report columns;
+        filters left as None (or empty) are not applied.
+        
+        Args:
+            status: Keep paths with this status ('MET', 'VIOLATED' or 'UNKNOWN').
+            path_type: Keep paths of this type ('min' or 'max').
+            path_group: Keep paths in this path group.
+            
+        Returns:
+            np.ndarray: Indices of the matching paths, in report order.
+        """
+        mask = np.ones(len(self), dtype=bool)
+
+        if status:
+            if status == "VIOLATED":
+                mask &= self.violated_arr
+            elif status == "MET":
+                mask &= self.known_arr & ~self.violated_arr
+            elif status == "UNKNOWN":
+                mask &= ~self.known_arr
+            else:
+                mask[:] = False
+
+        if path_type:
+            if path_type in self.path_type_names:
+                mask &= self.ptype_arr == self.path_type_names.index(path_type)
+            else:
+                mask[:] = False
+
+        if path_group:
+            mask &= np.array(self.path_groups, dtype=object) == path_group
+
+        return np.flatnonzero(mask)
 
     @property
     def worst_min_path(self) -> Optional[TimingPath]:
@@ -83,7 +327,7 @@ class TimingReport:
         """
         if self.worst_min_path_index is None:
             return None
-        return self.paths[self.worst_min_path_index]
+        return self[self.worst_min_path_index]
 
     @property
     def worst_max_path(self) -> Optional[TimingPath]:
@@ -94,10 +338,10 @@ class TimingReport:
         """
         if self.worst_max_path_index is None:
             return None
-        return self.paths[self.worst_max_path_index]
+        return self[self.worst_max_path_index]
 
 
-@dataclass
+@dataclass(slots=True)
 class SummaryStats:
     """Summary statistics for timing analysis.
     
@@ -123,37 +367,35 @@ class SummaryStats:
     best_slack:         Optional[float] = None
     
     @classmethod
-    def from_report(cls, report: TimingReport) -> 'SummaryStats':
+    def from_report(cls, report: TimingReport, jit: bool = False) -> 'SummaryStats':
         """Generate summary statistics from a TimingReport.
+
+        NumPy reductions are used by default. The numba kernel only pays off
+        when summarizing many reports in one process, since importing numba
+        costs far more than it saves on a single report.
         
         Args:
             report: TimingReport object containing timing paths to analyze.
+            jit: Use the numba-compiled kernel (falls back to NumPy if numba
+                is not installed).
             
         Returns:
             SummaryStats: Statistics object with calculated metrics.
         """
-        paths_with_slack = [p for p in report.paths if p.slack is not None]
-        min_paths = [p for p in paths_with_slack if p.path_type == "min"]
-        max_paths = [p for p in paths_with_slack if p.path_type == "max"]
-        
-        violated = [p for p in paths_with_slack if p.slack < 0]
-        met = [p for p in paths_with_slack if p.slack >= 0]
-        
-        # Calculate worst/best slacks
-        all_slacks = [p.slack for p in paths_with_slack]
-        min_slacks = [p.slack for p in min_paths]
-        max_slacks = [p.slack for p in max_paths]
+        kernel = _stats_kernel() if jit else _stats_numpy
+        (total, min_ct, max_ct, violated, met,
+         worst, worst_min, worst_max, best) = kernel(report.slack_arr, report.ptype_arr)
         
         return cls(
-            total_paths=len(report.paths),
-            min_paths=len(min_paths),
-            max_paths=len(max_paths),
-            violated_paths=len(violated),
-            met_paths=len(met),
-            worst_slack=min(all_slacks) if all_slacks else None,
-            worst_min_slack=min(min_slacks) if min_slacks else None,
-            worst_max_slack=min(max_slacks) if max_slacks else None,
-            best_slack=max(all_slacks) if all_slacks else None,
+            total_paths=int(total),
+            min_paths=int(min_ct),
+            max_paths=int(max_ct),
+            violated_paths=int(violated),
+            met_paths=int(met),
+            worst_slack=_none_if_nan(worst),
+            worst_min_slack=_none_if_nan(worst_min),
+            worst_max_slack=_none_if_nan(worst_max),
+            best_slack=_none_if_nan(best),
         )
     
     def __str__(self) -> str:
@@ -184,7 +426,7 @@ class SummaryStats:
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisConfig:
     """
     Configuration for timing analysis operations.
@@ -234,93 +476,492 @@ class AnalysisConfig:
         Returns:
             True if status, type, or group filters are set.
         """
-        return any([self.filter_status, self.filter_type, self.filter_group])
+        return bool(self.filter_status or self.filter_type or self.filter_group)
 
 
-def parse_report(filename: str) -> TimingReport:
-    """
-    Parse an EDA timing report file and extract timing path information.
+def _nan_if_none(value: Optional[float]) -> float:
+    """Convert a missing value to NaN for storage in a float column."""
+    return np.nan if value is None else value
+
+
+def _none_if_nan(value: float) -> Optional[float]:
+    """Convert a float read from a column back to None if it is NaN."""
+    return None if math.isnan(value) else value
+
+
+def _stats_loop(slack_arr: np.ndarray, ptype_arr: np.ndarray) -> tuple[float, ...]:
+    """Compute summary statistics of the slack column in a single pass.
+
+    Written as a plain loop so numba can compile it; see _stats_kernel.
     
     Args:
-        filename: Path to the timing report file.
+        slack_arr: Slack of each path (NaN if not found).
+        ptype_arr: Path type code of each path.
         
     Returns:
-        TimingReport object containing all parsed paths and metadata.
+        tuple[float, ...]: (total, min_paths, max_paths, violated, met, worst,
+            worst_min, worst_max, best), where slack values are NaN if no path has one.
+    """
+    total = slack_arr.shape[0]
+    min_ct = 0
+    max_ct = 0
+    violated = 0
+    met = 0
+    worst = math.inf
+    worst_min = math.inf
+    worst_max = math.inf
+    best = -math.inf
+
+    for i in range(total):
+        slack = slack_arr[i]
+        if math.isnan(slack):
+            continue
+
+        if slack < 0.0:
+            violated += 1
+        else:
+            met += 1
+        worst = min(worst, slack)
+        best = max(best, slack)
+
+        if ptype_arr[i] == 0:
+            min_ct += 1
+            worst_min = min(worst_min, slack)
+        elif ptype_arr[i] == 1:
+            max_ct += 1
+            worst_max = min(worst_max, slack)
+
+    if violated + met == 0:
+        worst = math.nan
+        best = math.nan
+    if min_ct == 0:
+        worst_min = math.nan
+    if max_ct == 0:
+        worst_max = math.nan
+
+    return (float(total), float(min_ct), float(max_ct), float(violated), float(met),
+            worst, worst_min, worst_max, best)
+
+
+def _stats_numpy(slack_arr: np.ndarray, ptype_arr: np.ndarray) -> tuple[float, ...]:
+    """Compute the same statistics as _stats_loop with NumPy reductions.
+    
+    Args:
+        slack_arr: Slack of each path (NaN if not found).
+        ptype_arr: Path type code of each path.
         
-    Raises:
-        OSError: If the file cannot be opened or read.
+    Returns:
+        tuple[float, ...]: Same layout as _stats_loop.
     """
-    logging.debug(f"Opening timing report: {filename}")
+    valid = ~np.isnan(slack_arr)
+    slacks = slack_arr[valid]
+    ptypes = ptype_arr[valid]
+
+    # Slacks of min (code 0) and max (code 1) paths
+    min_slacks = slacks[ptypes == 0]
+    max_slacks = slacks[ptypes == 1]
+
+    violated = np.count_nonzero(slacks < 0)
+
+    return (
+        float(len(slack_arr)),
+        float(len(min_slacks)),
+        float(len(max_slacks)),
+        float(violated),
+        float(len(slacks) - violated),
+        float(slacks.min()) if slacks.size else math.nan,
+        float(min_slacks.min()) if min_slacks.size else math.nan,
+        float(max_slacks.min()) if max_slacks.size else math.nan,
+        float(slacks.max()) if slacks.size else math.nan,
+    )
+
+
+@functools.cache
+def _stats_kernel() -> Callable[[np.ndarray, np.ndarray], tuple[float, ...]]:
+    """Return the function used by SummaryStats.from_report(jit=True).
+
+    numba is optional and only imported on first use, so runs without
+    jit=True never pay its import cost. When installed, _stats_loop is compiled with
+    cache=True so the compilation is reused across runs.
+    
+    Returns:
+        Callable: The compiled _stats_loop, or _stats_numpy if numba is not installed.
+    """
+    try:
+        import numba
+    except ImportError:
+        return _stats_numpy
+    return numba.njit(cache=True)(_stats_loop)
+
+
+def _worst_index(slack_arr: np.ndarray, ptype_arr: np.ndarray, code: int) -> Optional[int]:
+    """Find the path with the lowest slack among paths of one type.
     
-    paths: list[TimingPath] = []
-    current_path = None
+    Args:
+        slack_arr: Slack of each path (NaN if not found).
+        ptype_arr: Path type code of each path.
+        code: Path type code to search (0 for min, 1 for max).
+        
+    Returns:
+        Optional[int]: Row of the first path with the lowest slack, or None if no
+            path of that type has a slack value.
+    """
+    mask = (ptype_arr == code) & ~np.isnan(slack_arr)
+    if not mask.any():
+        return None
+    return int(np.flatnonzero(mask)[np.argmin(slack_arr[mask])])
 
-    with open(filename, "r") as f:
-        for line in f:
-            line = line.strip()
 
-            # ["Startpoint:", Start, Info]
-            if line.startswith("Startpoint:"):
-                current_path = TimingPath()
-                paths.append(current_path)
-                current_path.startpoint = line.split(maxsplit=2)[1]
-                logging.debug(f"Found path #{len(paths)}: {current_path.startpoint}")
+def _line_start(text: ReportBuffer, pos: int, lo: int) -> int:
+    """Return the start of the line containing text[pos], but not before lo."""
+    newline = text.rfind(b"\n", lo, pos)
+    return lo if newline < 0 else newline + 1
 
-            # ["Startpoint:", End, Info]
-            elif line.startswith("Endpoint:") and current_path:
-                current_path.endpoint = line.split(maxsplit=2)[1]
 
-            # ["Path Group:", Clk]
-            elif line.startswith("Path Group:") and current_path:
-                current_path.path_group = line.split(maxsplit=2)[-1]
+def _line_end(text: ReportBuffer, pos: int, hi: int) -> int:
+    """Return the end of the line containing text[pos], but not after hi."""
+    end = text.find(b"\n", pos, hi)
+    return hi if end < 0 else end
 
-            # ["Path Type:", Type]
-            elif line.startswith("Path Type:") and current_path:
-                current_path.path_type = line.split(maxsplit=2)[-1]
 
-            # [time_value, "data required time"]
-            elif "data required time" in line and current_path:
-                current_path.required_time = float(line.split(maxsplit=1)[0])
+def _first_word(text: ReportBuffer, pos: int, hi: int) -> bytes:
+    """Return the first whitespace-delimited word between pos and the end of its line."""
+    words = text[pos:_line_end(text, pos, hi)].split(None, 1)
+    return words[0] if words else b""
 
-            # [time_value, "data arrival time"]
-            elif "data arrival time" in line and current_path:
-                current_path.arrival_time = float(line.split(maxsplit=1)[0])
 
-            elif "slack" in line and current_path:
-                parts = line.split()
+def _rest_of_line(text: ReportBuffer, pos: int, hi: int) -> bytes:
+    """Return the stripped text between pos and the end of its line."""
+    return text[pos:_line_end(text, pos, hi)].strip()
 
-                # [slack_value, "slack", "MET/VIOLATED"]
-                if len(parts) == 3:
-                    # skip invalid lines
-                    try:
-                        slack = float(parts[0])
-                    except ValueError:
-                        continue
 
-                    current_path.slack = slack
+def _starts_line(text: ReportBuffer, pos: int, lo: int) -> bool:
+    """Check that only whitespace precedes text[pos] on its line."""
+    # Field lines usually start in the first column, which is decided by
+    # the single byte before pos
+    if pos == lo or text[pos - 1] == 0x0A:
+        return True
+    return not text[_line_start(text, pos, lo):pos].strip()
 
-    logging.info(f"Parsed {len(paths)} timing paths\n")
+
+def _find_line_prefix(text: ReportBuffer, prefix: bytes, lo: int, hi: int) -> int:
+    """Find prefix at the start of the first line in text[lo:hi] that begins with it.
     
-    # Find worst min path (lowest slack among "min" type paths)
-    min_paths = [(i, path) for i, path in enumerate(paths) 
-                 if path.path_type == "min" and path.slack is not None]
-    worst_min_idx = min(min_paths, key=lambda x: x[1].slack)[0] if min_paths else None
+    Args:
+        text: Full report text.
+        prefix: Line prefix to look for, e.g. "Endpoint:".
+        lo: Start of the searched range.
+        hi: End of the searched range.
+        
+    Returns:
+        int: Position of prefix, or -1 if no line in the range starts with it.
+    """
+    pos = text.find(prefix, lo, hi)
+    while pos >= 0 and not _starts_line(text, pos, lo):
+        pos = text.find(prefix, pos + len(prefix), hi)
+    return pos
+
+
+def _rfind_slack(text: ReportBuffer, lo: int, hi: int) -> Optional[float]:
+    """Read the slack value of the last slack line in text[lo:hi].
     
-    # Find worst max path (lowest slack among "max" type paths)
-    max_paths = [(i, path) for i, path in enumerate(paths) 
-                 if path.path_type == "max" and path.slack is not None]
-    worst_max_idx = min(max_paths, key=lambda x: x[1].slack)[0] if max_paths else None
+    Slack lines have exactly three fields, e.g. "-0.567 slack (VIOLATED)";
+    other lines mentioning slack are skipped.
     
-    report = TimingReport(paths=paths)
-    report.worst_min_path_index = worst_min_idx
-    report.worst_max_path_index = worst_max_idx
+    Args:
+        text: Full report text.
+        lo: Start of the searched range.
+        hi: End of the searched range.
+        
+    Returns:
+        Optional[float]: The slack value, or None if the range has no valid slack line.
+    """
+    pos = text.rfind(SLACK_MARK, lo, hi)
+    while pos >= 0:
+        start = _line_start(text, pos, lo)
+        parts = text[start:_line_end(text, pos, hi)].split()
+
+        # [slack_value, "slack", "MET/VIOLATED"]
+        if len(parts) == 3:
+            # skip invalid lines
+            try:
+                return float(parts[0])
+            except ValueError:
+                pass
+
+        pos = text.rfind(SLACK_MARK, lo, start)
+    return None
+
+
+def _path_starts(text: ReportBuffer) -> list[int]:
+    """Return the start offset of every line beginning with START_PREFIX."""
+    starts = []
+    pos = text.find(START_PREFIX)
+    while pos >= 0:
+        if _starts_line(text, pos, 0):
+            starts.append(_line_start(text, pos, 0))
+        pos = text.find(START_PREFIX, pos + len(START_PREFIX))
+    return starts
+
+
+# Generated path scanner. Startpoint lines always delimit paths; every
+# other field is one snippet, so a scanner only contains the fields it was
+# built for. Prefixes, markers and their lengths are inlined as constants.
+_SCANNER_TEMPLATE: Final = """\
+def _scan(text):
+    bounds = _path_starts(text)
+    n = len(bounds)
+    bounds.append(len(text))
+
+    startpoints = [""] * n
+    endpoints = [""] * n
+    path_groups = [""] * n
+    type_codes = {{name.encode(): code for code, name in enumerate(PATH_TYPES)}}
+
+    # Reports have few distinct path groups, so equal groups share one
+    # string, decoded once per group
+    group_cache = {{b"": ""}}
+
+    required = np.full(n, np.nan, dtype=np.float64)
+    arrival = np.full(n, np.nan, dtype=np.float64)
+    slack = np.full(n, np.nan, dtype=np.float64)
+    ptype = np.full(n, -1, dtype=np.int32)
+
+    # Raw time tokens and their rows, converted to floats in one call per
+    # column after the scan
+    required_rows = []
+    required_tokens = []
+    arrival_rows = []
+    arrival_tokens = []
+
+    # Checked once per report instead of once per path
+    debug = logger.isEnabledFor(logging.DEBUG)
+
+    for row in range(n):
+        lo = bounds[row]
+        hi = bounds[row + 1]
+
+        # ["Startpoint:", Start, Info]
+        # start and end points repeat across paths (fanout), so names are
+        # interned to share one string per pin
+        pos = text.find({start!r}, lo, hi)
+        startpoints[row] = sys.intern(_first_word(text, pos + {start_len}, hi).decode())
+        if debug:
+            logger.debug("Found path #%d: %s", row + 1, startpoints[row])
+{fields}
+    required[np.array(required_rows, dtype=np.intp)] = np.array(required_tokens, dtype=np.float64)
+    arrival[np.array(arrival_rows, dtype=np.intp)] = np.array(arrival_tokens, dtype=np.float64)
+
+    return TimingReport(
+        startpoints=startpoints,
+        endpoints=endpoints,
+        path_groups=path_groups,
+        required_arr=required,
+        arrival_arr=arrival,
+        slack_arr=slack,
+        ptype_arr=ptype,
+        path_type_names=[name.decode() for name in type_codes],
+        worst_min_path_index=_worst_index(slack, ptype, 0),
+        worst_max_path_index=_worst_index(slack, ptype, 1),
+    )
+"""
+
+_FIELD_SNIPPETS: Final = {
+    END_PREFIX: """
+        # ["Endpoint:", End, Info]
+        pos = _find_line_prefix(text, {mark!r}, lo, hi)
+        if pos >= 0:
+            endpoints[row] = sys.intern(_first_word(text, pos + {mark_len}, hi).decode())
+""",
+    GROUP_PREFIX: """
+        # ["Path Group:", Clk]
+        pos = _find_line_prefix(text, {mark!r}, lo, hi)
+        if pos >= 0:
+            path_group = _rest_of_line(text, pos + {mark_len}, hi)
+            if path_group not in group_cache:
+                group_cache[path_group] = path_group.decode()
+            path_groups[row] = group_cache[path_group]
+""",
+    TYPE_PREFIX: """
+        # ["Path Type:", Type]
+        pos = _find_line_prefix(text, {mark!r}, lo, hi)
+        if pos >= 0:
+            path_type = _rest_of_line(text, pos + {mark_len}, hi)
+            ptype[row] = type_codes.setdefault(path_type, len(type_codes))
+""",
+    REQUIRED_MARK: """
+        # [time_value, "data required time"]
+        # the line is cut after the marker, so it always has a first field
+        pos = text.rfind({mark!r}, lo, hi)
+        if pos >= 0:
+            required_rows.append(row)
+            required_tokens.append(text[_line_start(text, pos, lo):pos + {mark_len}].split(None, 1)[0])
+""",
+    ARRIVAL_MARK: """
+        # [time_value, "data arrival time"]
+        pos = text.rfind({mark!r}, lo, hi)
+        if pos >= 0:
+            arrival_rows.append(row)
+            arrival_tokens.append(text[_line_start(text, pos, lo):pos + {mark_len}].split(None, 1)[0])
+""",
+    SLACK_MARK: """
+        value = _rfind_slack(text, lo, hi)
+        if value is not None:
+            slack[row] = value
+""",
+}
+
+# Fields accepted in a parse_report_factory schema
+PARSER_FIELDS: Final = frozenset(mark.decode() for mark in _FIELD_SNIPPETS)
+
+
+@functools.cache
+def _build_scanner(fields: frozenset[str]) -> Callable[[ReportBuffer], TimingReport]:
+    """Generate and compile a path scanner for the given fields.
+
+    The generated source is registered with linecache so tracebacks and
+    debuggers can still show it.
     
-    logging.debug(f"Worst min path index: {worst_min_idx}")
-    logging.debug(f"Worst max path index: {worst_max_idx}")
+    Args:
+        fields: Subset of PARSER_FIELDS to extract.
+        
+    Returns:
+        Callable: Function taking report contents and returning a TimingReport.
+    """
+    snippets = []
+    for mark, snippet in _FIELD_SNIPPETS.items():
+        if mark.decode() in fields:
+            snippets.append(snippet.format(mark=mark, mark_len=len(mark)))
+
+    source = _SCANNER_TEMPLATE.format(
+        start=START_PREFIX,
+        start_len=len(START_PREFIX),
+        fields="".join(snippets),
+    )
+    filename = f"<scanner {sorted(fields)}>"
+    linecache.cache[filename] = (len(source), None, source.splitlines(keepends=True), filename)
+
+    namespace: dict[str, Callable[[ReportBuffer], TimingReport]] = {}
+    exec(compile(source, filename, "exec"), globals(), namespace)
+    return namespace["_scan"]
+
+
+def _parse_file(filename: str, scan: Callable[[ReportBuffer], TimingReport]) -> TimingReport:
+    """Open a timing report and parse its contents with the given scanner.
+
+    The report is scanned as raw bytes, with only the extracted fields
+    decoded. Files of _MMAP_THRESHOLD bytes or more are memory-mapped
+    rather than copied into memory.
+    
+    Args:
+        filename: Path to the timing report file.
+        scan: Scanner built by _build_scanner.
+        
+    Returns:
+        TimingReport object containing all parsed paths and metadata.
+        
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    logger.debug("Opening timing report: %s", filename)
+
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                report = scan(buf)
+        else:
+            report = scan(f.read())
+
+    logger.info("Parsed %d timing paths\n", len(report))
+    logger.debug("Worst min path index: %s", report.worst_min_path_index)
+    logger.debug("Worst max path index: %s", report.worst_max_path_index)
     
     return report
 
 
+def parse_report(filename: str) -> TimingReport:
+    """
+    Parse an EDA timing report file and extract timing path information.
+
+    Each path spans from its Startpoint line to the next Startpoint line
+    (or the end of the file). Instead of testing every line, the parser
+    locates each field in a path with find/rfind, so only the few
+    lines that hold a value are examined in Python. Header fields are
+    taken from their first line in the path, and times and slack from
+    their last line (the final slack calculation).
+    
+    Args:
+        filename: Path to the timing report file.
+        
+    Returns:
+        TimingReport object containing all parsed paths and metadata.
+        
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    return _parse_file(filename, _build_scanner(PARSER_FIELDS))
+
+
+def parse_report_factory(schema: set[str]) -> Callable[[str], TimingReport]:
+    """
+    Build a parse_report variant that only extracts the given fields.
+
+    The returned parser is generated and compiled once per schema, without
+    the code for fields outside it. Fields that are not extracted keep their
+    defaults ("" for strings, NaN for times and slack, -1 for path type);
+    worst paths are only found when both "slack" and "Path Type:" are in
+    the schema. Startpoint lines always delimit paths.
+    
+    Args:
+        schema: Line prefixes or markers to extract, a subset of PARSER_FIELDS
+            (e.g. {"Path Type:", "slack"}).
+        
+    Returns:
+        Callable[[str], TimingReport]: Parser taking a report filename, like parse_report.
+        
+    Raises:
+        ValueError: If the schema contains an unknown field.
+    """
+    unknown = set(schema) - PARSER_FIELDS
+    if unknown:
+        raise ValueError(f"Unknown report fields: {', '.join(sorted(unknown))}")
+
+    scan = _build_scanner(frozenset(schema))
+
+    def parse(filename: str) -> TimingReport:
+        """Parse a timing report, extracting only the fields in the factory schema."""
+        return _parse_file(filename, scan)
+
+    return parse
+
+
+def parse_reports(filenames: Iterable[str], workers: Optional[int] = None) -> list[TimingReport]:
+    """
+    Parse several timing reports in parallel worker processes.
+
+    Reports are independent, so each one is parsed by parse_report in a
+    ProcessPoolExecutor and the resulting TimingReport (a few lists and
+    numpy columns) is pickled back. With workers=1 the reports are parsed
+    serially in this process, without starting a pool.
+    
+    Args:
+        filenames: Paths to the timing report files.
+        workers: Maximum number of worker processes (default: CPU count).
+        
+    Returns:
+        list[TimingReport]: Parsed reports, in the same order as filenames.
+        
+    Raises:
+        OSError: If a file cannot be opened or read.
+    """
+    filenames = list(filenames)
+    if workers == 1 or len(filenames) <= 1:
+        return [parse_report(filename) for filename in filenames]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse_report, filenames))
+
+
 def print_worst_paths(report: TimingReport) -> None:
     """
     Display worst min and max paths from the report.
@@ -349,27 +990,28 @@ def print_filtered_paths(report: TimingReport, config: AnalysisConfig) -> None:
         report: TimingReport containing parsed timing paths.
         config: AnalysisConfig with filter settings.
     """
-    filtered_paths = report.paths
+    rows = report.filter_indices(
+        status=config.filter_status,
+        path_type=config.filter_type,
+        path_group=config.filter_group,
+    )
     filters_applied = []
     
     if config.filter_status:
-        filtered_paths = [p for p in filtered_paths if p.status == config.filter_status]
         filters_applied.append(f"status={config.filter_status}")
     
     if config.filter_type:
-        filtered_paths = [p for p in filtered_paths if p.path_type == config.filter_type]
         filters_applied.append(f"type={config.filter_type}")
     
     if config.filter_group:
-        filtered_paths = [p for p in filtered_paths if p.path_group == config.filter_group]
         filters_applied.append(f"group={config.filter_group}")
     
     print(f"{'='*50}")
     print(f"FILTERED PATHS: {', '.join(filters_applied)}")
     print(f"{'='*50}")
-    print(f"Found {len(filtered_paths)} matching paths\n")
+    print(f"Found {len(rows)} matching paths\n")
     
-    for i, path in enumerate(filtered_paths, 1):
+    for i, path in enumerate(report.iter_paths(rows), 1):
         print(f"Path #{i}:")
         print(path)
         print()
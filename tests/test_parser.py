@@ -1,6 +1,10 @@
 import pytest
+import logging
 from pathlib import Path
-from eda_file_parser.parser import parse_report, TimingPath, TimingReport
+from eda_file_parser.parser import parse_report, TimingPath, TimingReport, SummaryStats, AnalysisConfig
+from eda_file_parser.parser import parse_report_factory, parse_reports, PARSER_FIELDS
+from eda_file_parser.parser import print_filtered_paths, main
+from eda_file_parser.parser import _stats_loop, _stats_numpy
 
 # scope='module' means this fixture is created once per test file, not once per test function
 @pytest.fixture(scope="module")
@@ -68,6 +72,7 @@ class TestParser:
         report = parse_report(str(report_paths["empty"]))
         
         assert report is not None
+        assert report
         assert len(report.paths) == 0
 
         # path = report.paths[0]
@@ -88,6 +93,189 @@ class TestParser:
         report = parse_report(str(report_paths[report_name]))
         assert len(report.paths) >= expected_min_paths
 
+    def test_worst_path_indices(self, report_paths):
+        """Test worst min and max paths are the lowest slack path of each type."""
+        report = parse_report(str(report_paths["mixed_paths"]))
+
+        assert report.worst_min_path_index == 0
+        assert report.worst_max_path_index == 1
+        assert report.worst_min_path.startpoint == "reg_min_violated"
+        assert report.worst_max_path.startpoint == "reg_max_violated"
+
+    def test_worst_path_indices_empty(self, report_paths):
+        """Test an empty report has no worst paths."""
+        report = parse_report(str(report_paths["empty"]))
+
+        assert report.worst_min_path is None
+        assert report.worst_max_path is None
+
+    def test_worst_path_ties_pick_first(self, tmp_path):
+        """Test the first of several paths with equal worst slack is reported."""
+        report_file = tmp_path / "ties.rpt"
+        report_file.write_text("".join(
+            f"Startpoint: {name}\nPath Type: {ptype}\n{slack} slack (MET)\n"
+            for name, ptype, slack in [
+                ("a", "max", "1.0"), ("b", "min", "0.5"), ("c", "max", "0.2"),
+                ("d", "max", "0.2"), ("e", "min", "0.5"),
+            ]
+        ))
+        report = parse_report(str(report_file))
+
+        assert report.worst_min_path_index == 1
+        assert report.worst_max_path_index == 2
+
+    def test_path_groups_are_shared(self, report_paths):
+        """Test paths in the same group share a single group string."""
+        report = parse_report(str(report_paths["mixed_paths"]))
+
+        assert report.path_groups == ["clk_group", "clk_group", "other_group", "other_group"]
+        assert report.path_groups[0] is report.path_groups[1]
+        assert report.path_groups[2] is report.path_groups[3]
+
+    def test_start_and_end_points_are_interned(self, tmp_path):
+        """Test repeated start and end points share a single string."""
+        report_file = tmp_path / "fanout.rpt"
+        report_file.write_text(
+            "Startpoint: reg_a (rising edge-triggered flip-flop)\nEndpoint: reg_b\n"
+            "Startpoint: reg_b (rising edge-triggered flip-flop)\nEndpoint: reg_c\n"
+            "Startpoint: reg_a (rising edge-triggered flip-flop)\nEndpoint: reg_c\n"
+        )
+        report = parse_report(str(report_file))
+
+        assert report.startpoints == ["reg_a", "reg_b", "reg_a"]
+        assert report.startpoints[0] is report.startpoints[2]
+        assert report.startpoints[1] is report.endpoints[0]
+        assert report.endpoints[1] is report.endpoints[2]
+
+    def test_parse_ignores_unrelated_lines(self, tmp_path):
+        """Test markers that are not on their own field line do not start or fill paths."""
+        report_file = tmp_path / "noise.rpt"
+        report_file.write_text(
+            "# see Startpoint: docs\n"
+            "0.5 slack (MET)\n"
+            "  Startpoint: reg_a (rising edge-triggered flip-flop)\n"
+            "  Endpoint: reg_b (rising edge-triggered flip-flop)\n"
+            "  Path Group: clk\n"
+            "  Path Type: max\n"
+            "     1.000   data arrival time\n"
+            "     3.000   data required time\n"
+            "    -1.000   data arrival time\n"
+            "     2.000   slack (MET)\n"
+            "worst slack max 2.000\n"
+            "utl::metric worst_slack [expr]\n"
+        )
+        report = parse_report(str(report_file))
+
+        assert len(report) == 1
+        path = report[0]
+        assert path.startpoint == "reg_a"
+        assert path.endpoint == "reg_b"
+        assert path.path_group == "clk"
+        assert path.path_type == "max"
+        assert path.required_time == 3.0
+        assert path.arrival_time == -1.0
+        assert path.slack == 2.0
+
+    def test_parse_times_from_first_token(self, tmp_path):
+        """Test times are read from the first field of lines with extra columns."""
+        report_file = tmp_path / "columns.rpt"
+        report_file.write_text(
+            "Startpoint: reg_a\n"
+            "  0.10  3.00   data required time\n"
+            "  2.00 ^ data arrival time\n"
+        )
+        path = parse_report(str(report_file))[0]
+
+        assert path.required_time == 0.10
+        assert path.arrival_time == 2.00
+
+    def test_parse_tab_separated_names(self, tmp_path):
+        """Test start and end points end at any whitespace, not only spaces."""
+        report_file = tmp_path / "tabs.rpt"
+        report_file.write_text(
+            "Startpoint:\treg_a\t(rising edge-triggered flip-flop)\n"
+            "Endpoint:\treg_b\t(rising edge-triggered flip-flop)\n"
+        )
+        path = parse_report(str(report_file))[0]
+
+        assert path.startpoint == "reg_a"
+        assert path.endpoint == "reg_b"
+
+    def test_parse_memory_mapped_report(self, report_paths, monkeypatch):
+        """Test large reports parsed through mmap match reports read into memory."""
+        expected = parse_report(str(report_paths["timing_full"]))
+        monkeypatch.setattr("eda_file_parser.parser._MMAP_THRESHOLD", 1)
+        report = parse_report(str(report_paths["timing_full"]))
+
+        assert report.startpoints == expected.startpoints
+        assert report.path_groups == expected.path_groups
+        assert report.slack_arr.tolist() == expected.slack_arr.tolist()
+        assert report.worst_max_path_index == expected.worst_max_path_index
+
+    def test_per_path_debug_logging(self, report_paths, caplog):
+        """Test per-path debug records are only emitted when debug is enabled."""
+        with caplog.at_level(logging.INFO, logger="eda_file_parser.parser"):
+            parse_report(str(report_paths["mixed_paths"]))
+        assert not any(r.getMessage().startswith("Found path") for r in caplog.records)
+
+        caplog.clear()
+        with caplog.at_level(logging.DEBUG, logger="eda_file_parser.parser"):
+            parse_report(str(report_paths["mixed_paths"]))
+        assert "Found path #1: reg_min_violated" in caplog.messages
+
+    def test_factory_full_schema_matches_parse_report(self, report_paths):
+        """Test a parser built for every field gives the same result as parse_report."""
+        parse = parse_report_factory(set(PARSER_FIELDS))
+        report = parse(str(report_paths["timing_full"]))
+        expected = parse_report(str(report_paths["timing_full"]))
+
+        assert report.endpoints == expected.endpoints
+        assert report.path_groups == expected.path_groups
+        assert report.arrival_arr.tolist() == expected.arrival_arr.tolist()
+        assert report.slack_arr.tolist() == expected.slack_arr.tolist()
+        assert report.worst_min_path_index == expected.worst_min_path_index
+
+    def test_factory_partial_schema(self, report_paths):
+        """Test fields outside the schema keep their defaults."""
+        parse = parse_report_factory({"Path Type:", "slack"})
+        report = parse(str(report_paths["mixed_paths"]))
+
+        assert report.startpoints[0] == "reg_min_violated"
+        assert report.endpoints == ["", "", "", ""]
+        assert report.path_groups == ["", "", "", ""]
+        assert report[0].required_time is None
+        assert report[0].path_type == "min"
+        assert report[0].slack == -0.2
+        assert report.worst_max_path_index == 1
+
+    def test_factory_without_path_type_skips_worst_paths(self, report_paths):
+        """Test worst paths are not tracked when path types are not extracted."""
+        report = parse_report_factory({"slack"})(str(report_paths["mixed_paths"]))
+
+        assert report.slack_arr.tolist() == [-0.2, -2.0, 1.0, 2.0]
+        assert report.worst_min_path is None
+        assert report.worst_max_path is None
+
+    def test_factory_rejects_unknown_fields(self):
+        """Test an unknown schema field raises ValueError."""
+        with pytest.raises(ValueError, match="Clock Skew:"):
+            parse_report_factory({"slack", "Clock Skew:"})
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_parse_reports_matches_parse_report(self, report_paths, workers):
+        """Test parsing several reports in parallel keeps their order and contents."""
+        names = ["simple_met", "mixed_paths", "empty", "timing_full"]
+        reports = parse_reports([str(report_paths[name]) for name in names], workers=workers)
+
+        assert len(reports) == len(names)
+        for name, report in zip(names, reports):
+            expected = parse_report(str(report_paths[name]))
+            assert report.startpoints == expected.startpoints
+            assert report.path_groups == expected.path_groups
+            assert report.slack_arr.tolist() == expected.slack_arr.tolist()
+            assert report.violated_arr.tolist() == expected.violated_arr.tolist()
+            assert report.worst_min_path_index == expected.worst_min_path_index
+
     def test_reports_directory_exists(self, reports_dir):
         """Verify reports directory is accessible."""
         assert reports_dir.exists()
@@ -122,6 +310,23 @@ class TestTimingPath:
         assert path.path_type == "min"
         assert path.slack == 0.5
 
+    def test_timing_path_has_no_instance_dict(self):
+        """Test TimingPath uses slots instead of a per-instance __dict__."""
+        path = TimingPath(startpoint="reg_a")
+
+        assert not hasattr(path, "__dict__")
+        with pytest.raises(AttributeError):
+            path.unknown_field = 1
+
+    def test_timing_path_compares_by_value(self, report_paths):
+        """Test paths built from the same row compare equal and repr their fields."""
+        report = parse_report(str(report_paths["mixed_paths"]))
+
+        assert report.worst_min_path == report.worst_min_path
+        assert report[0] in list(report.paths)
+        assert report[0] != report[1]
+        assert repr(report[0]).startswith("TimingPath(startpoint='reg_min_violated'")
+
     @pytest.mark.parametrize("slack, expected_status", [
         (0.5, "MET"),
         (-0.1, "VIOLATED"),
@@ -144,3 +349,248 @@ class TestTimingReport:
         assert report.paths == []
         assert report.worst_min_path_index is None
         assert report.worst_max_path_index is None
+
+    def test_report_indexing_builds_paths(self, report_paths):
+        """Test indexing a parsed report builds TimingPath objects from its columns."""
+        report = parse_report(str(report_paths["mixed_paths"]))
+
+        assert len(report) == 4
+        path = report[1]
+        assert isinstance(path, TimingPath)
+        assert path.startpoint == "reg_max_violated"
+        assert path.path_group == "clk_group"
+        assert path.path_type == "max"
+        assert path.slack == -2.0
+        assert report.slack_arr[1] == -2.0
+        assert report[-1].startpoint == report.paths[-1].startpoint == "reg_max_met"
+
+    def test_paths_view_is_lazy_sequence(self, report_paths):
+        """Test report.paths builds paths on access and supports sequence operations."""
+        report = parse_report(str(report_paths["mixed_paths"]))
+        paths = report.paths
+
+        assert not isinstance(paths, list)
+        assert len(paths) == 4
+        assert [p.startpoint for p in paths] == report.startpoints
+        assert [p.slack for p in paths[1:3]] == [-2.0, 1.0]
+        assert paths[0] is not paths[0]
+        with pytest.raises(IndexError):
+            paths[4]
+
+    def test_iter_paths_reads_rows(self, report_paths):
+        """Test paths built in bulk match indexed paths and hold Python floats."""
+        report = parse_report(str(report_paths["mixed_paths"]))
+        rows = report.filter_indices(status="VIOLATED")
+        paths = list(report.iter_paths(rows))
+
+        assert [p.startpoint for p in paths] == ["reg_min_violated", "reg_max_violated"]
+        assert [str(p) for p in paths] == [str(report[i]) for i in rows.tolist()]
+        assert type(paths[0].slack) is float
+        assert type(report[0].slack) is float
+        assert [str(p) for p in report.iter_paths()] == [str(report[i]) for i in range(len(report))]
+
+    def test_paths_view_compares_by_value(self, report_paths):
+        """Test non-empty path views compare, search and count paths by value."""
+        report = parse_report(str(report_paths["mixed_paths"]))
+        paths = report.paths
+        other = parse_report(str(report_paths["mixed_paths"])).paths
+
+        assert paths == paths
+        assert paths[0] == paths[0]
+        assert paths == other
+        assert paths == list(other)
+        assert paths != parse_report(str(report_paths["timing_full"])).paths
+        assert paths != list(other)[:3]
+        assert paths != [1, 2, 3, 4]
+
+        assert report[2] in paths
+        assert TimingPath(startpoint="reg_unknown") not in paths
+        assert paths.index(report[2]) == 2
+        assert paths.index(report[2], 1, 3) == 2
+        assert paths.count(report[2]) == 1
+        with pytest.raises(ValueError):
+            paths.index(report[0], 1)
+
+    def test_report_from_paths(self):
+        """Test building a report from TimingPath objects keeps missing values as None."""
+        paths = [
+            TimingPath(startpoint="a", path_type="max", slack=-0.25),
+            TimingPath(startpoint="b", path_group="clk"),
+        ]
+        report = TimingReport.from_paths(paths)
+
+        assert len(report) == 2
+        assert report[0].path_type == "max"
+        assert report[0].slack == -0.25
+        assert report[1].path_type == ""
+        assert report[1].path_group == "clk"
+        assert report[1].slack is None
+        assert report[1].required_time is None
+
+    @pytest.mark.parametrize("filters, expected", [
+        ({}, [0, 1, 2, 3]),
+        ({"status": "VIOLATED"}, [0, 1]),
+        ({"status": "MET"}, [2, 3]),
+        ({"path_type": "max"}, [1, 3]),
+        ({"path_group": "other_group"}, [2, 3]),
+        ({"status": "MET", "path_type": "min", "path_group": "other_group"}, [2]),
+        ({"path_group": "missing_group"}, []),
+    ])
+    def test_filter_indices(self, report_paths, filters, expected):
+        """Test filters select matching rows and combine with AND logic."""
+        report = parse_report(str(report_paths["mixed_paths"]))
+        assert report.filter_indices(**filters).tolist() == expected
+
+    def test_status_columns(self):
+        """Test the known/violated columns follow the slack column."""
+        report = TimingReport.from_paths([
+            TimingPath(slack=-0.1),
+            TimingPath(slack=0.0),
+            TimingPath(slack=None),
+        ])
+
+        assert report.known_arr.tolist() == [True, True, False]
+        assert report.violated_arr.tolist() == [True, False, False]
+
+    def test_many_path_types(self, tmp_path):
+        """Test reports with hundreds of distinct path types keep every type name."""
+        report_file = tmp_path / "types.rpt"
+        report_file.write_text("".join(
+            f"Startpoint: reg_{i}\nPath Type: type_{i}\n" for i in range(300)
+        ))
+        report = parse_report(str(report_file))
+
+        assert report[299].path_type == "type_299"
+        assert report.filter_indices(path_type="type_200").tolist() == [200]
+
+        rebuilt = TimingReport.from_paths(list(report.paths))
+        assert [p.path_type for p in rebuilt.paths] == [f"type_{i}" for i in range(300)]
+
+    def test_filter_indices_unknown_status(self):
+        """Test paths without slack only match the UNKNOWN status."""
+        report = TimingReport.from_paths([TimingPath(slack=None), TimingPath(slack=1.0)])
+
+        assert report.filter_indices(status="UNKNOWN").tolist() == [0]
+        assert report.filter_indices(status="MET").tolist() == [1]
+
+
+# @pytest.mark.unit
+class TestSummaryStats:
+    """Test suite for SummaryStats class."""
+
+    def test_summary_mixed_paths(self, report_paths):
+        """Test summary statistics over a report with min and max paths."""
+        stats = SummaryStats.from_report(parse_report(str(report_paths["mixed_paths"])))
+
+        assert stats.total_paths == 4
+        assert stats.min_paths == 2
+        assert stats.max_paths == 2
+        assert stats.violated_paths == 2
+        assert stats.met_paths == 2
+        assert stats.worst_slack == -2.0
+        assert stats.worst_min_slack == -0.2
+        assert stats.worst_max_slack == -2.0
+        assert stats.best_slack == 2.0
+
+    def test_summary_empty_report(self, report_paths):
+        """Test summary statistics of an empty report have no slack values."""
+        stats = SummaryStats.from_report(parse_report(str(report_paths["empty"])))
+
+        assert stats.total_paths == 0
+        assert stats.violated_paths == 0
+        assert stats.worst_slack is None
+        assert stats.worst_min_slack is None
+        assert stats.best_slack is None
+
+    def test_summary_ignores_missing_slack(self):
+        """Test paths without slack count toward the total only."""
+        report = TimingReport.from_paths([
+            TimingPath(path_type="min", slack=0.3),
+            TimingPath(path_type="max"),
+        ])
+        stats = SummaryStats.from_report(report)
+
+        assert stats.total_paths == 2
+        assert stats.min_paths == 1
+        assert stats.max_paths == 0
+        assert stats.met_paths == 1
+        assert stats.worst_max_slack is None
+
+    @pytest.mark.parametrize("report_name", ["timing_full", "mixed_paths", "empty"])
+    def test_stats_kernels_agree(self, report_paths, report_name):
+        """Test the single-pass loop and the NumPy fallback give identical results."""
+        report = parse_report(str(report_paths[report_name]))
+        loop_stats = _stats_loop(report.slack_arr, report.ptype_arr)
+        numpy_stats = _stats_numpy(report.slack_arr, report.ptype_arr)
+
+        assert loop_stats == pytest.approx(numpy_stats, nan_ok=True)
+
+    def test_summary_jit_is_opt_in(self, report_paths, monkeypatch):
+        """Test the numba kernel is only requested with jit=True and gives the same summary."""
+        report = parse_report(str(report_paths["timing_full"]))
+        jit_stats = SummaryStats.from_report(report, jit=True)
+
+        def fail():
+            raise AssertionError("numba kernel requested without jit=True")
+
+        monkeypatch.setattr("eda_file_parser.parser._stats_kernel", fail)
+        stats = SummaryStats.from_report(report)
+
+        assert str(stats) == str(jit_stats)
+        assert stats.violated_paths == jit_stats.violated_paths == 38
+
+
+# @pytest.mark.unit
+class TestAnalysisConfig:
+    """Test suite for AnalysisConfig class."""
+
+    @pytest.mark.parametrize("filters, expected", [
+        ({}, False),
+        ({"filter_status": "MET"}, True),
+        ({"filter_type": "min"}, True),
+        ({"filter_group": "clk"}, True),
+        ({"filter_group": ""}, False),
+    ])
+    def test_has_filters(self, filters, expected):
+        """Test has_filters is True only when a filter is set."""
+        config = AnalysisConfig(report_file="report.rpt", **filters)
+        assert config.has_filters() is expected
+
+
+# @pytest.mark.unit
+class TestCli:
+    """Test suite for the command-line output."""
+
+    def test_print_filtered_paths(self, report_paths, capsys):
+        """Test filtered paths are numbered and printed in report order."""
+        report = parse_report(str(report_paths["mixed_paths"]))
+        print_filtered_paths(report, AnalysisConfig(report_file="", filter_status="VIOLATED"))
+        out = capsys.readouterr().out
+
+        assert "FILTERED PATHS: status=VIOLATED" in out
+        assert "Found 2 matching paths" in out
+        assert out.index("Path #1:") < out.index("reg_min_violated")
+        assert out.index("Path #2:") < out.index("reg_max_violated")
+        assert "reg_min_met" not in out
+
+    @pytest.mark.parametrize("options, expected", [
+        (["--summary"], "Total Paths:          102"),
+        (["--worst"], "WORST (MAX) PATH"),
+        (["--status", "VIOLATED"], "Found 38 matching paths"),
+        (["--type", "min"], "Found 51 matching paths"),
+        (["--group", "core_clock", "--type", "max"], "type=max, group=core_clock"),
+    ])
+    def test_main(self, report_paths, monkeypatch, capsys, options, expected):
+        """Test the CLI parses the report and prints the requested analysis."""
+        monkeypatch.setattr("sys.argv", ["parser.py", str(report_paths["timing_full"]), *options])
+        main()
+        assert expected in capsys.readouterr().out
+
+    def test_main_missing_report(self, monkeypatch, capsys):
+        """Test a missing report exits with status 1 and an error message."""
+        monkeypatch.setattr("sys.argv", ["parser.py", "nonexistent_file.rpt"])
+        with pytest.raises(SystemExit) as excinfo:
+            main()
+
+        assert excinfo.value.code == 1
+        assert "ERROR (FileNotFoundError)" in capsys.readouterr().err